@@ -1,26 +1,606 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import calendar
+from concurrent.futures import ThreadPoolExecutor
 import time
 import pytz
-from utils import format_time, format_date, get_date_range, get_pacific_time
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from utils import format_time, format_date, get_date_range, get_pacific_time, lttb_indices, DATE_FORMAT
 from api_clients import (
-    get_tide_data, 
-    get_current_data, 
     get_ferry_schedule, 
-    get_weather_data,
-    get_sun_times
+    get_all_data,
+    get_sun_times,
+    clear_cached_dates
 )
 from recommendation_engine import (
-    get_launch_recommendations,
+    get_launch_recommendation_frame,
     OPTIMAL_COLOR,
     ACCEPTABLE_COLOR,
     NOT_RECOMMENDED_COLOR
 )
 from marine_info import get_marine_weather_text, get_tide_information, get_marine_observations
 
+# Upper bound on points handed to Plotly for a single chart
+MAX_CHART_POINTS = 2000
+
+# Launch ratings from worst to best
+RATING_LEVELS = ['not_recommended', 'acceptable', 'optimal']
+
+# Banner color and status text for each rating
+RATING_META = {
+    'optimal': (OPTIMAL_COLOR, "OPTIMAL TIME TO LAUNCH! 🚣"),
+    'acceptable': (ACCEPTABLE_COLOR, "ACCEPTABLE TO LAUNCH"),
+    'not_recommended': (NOT_RECOMMENDED_COLOR, "NOT RECOMMENDED FOR LAUNCH")
+}
+
+# HTML templates for launch window cards, filled from recommendation dicts
+WINDOW_CARD_TEMPLATE = (
+    '<div style="flex: 1; padding: 15px; border-radius: 10px; background-color: {color}; text-align: center;">'
+    '<h3 style="margin:0; color: white;">{start_time} - {end_time}</h3>'
+    '</div>'
+)
+WINDOW_DETAIL_TEMPLATE = (
+    '<div style="padding: 10px; border-radius: 5px; background-color: {background}; margin-bottom: 10px;">'
+    '<h4 style="margin:0; color: {color};">🚣 {start_time} - {end_time}</h4>'
+    '<p style="margin:0;">Tide: {tide_height}ft | Current: {current_speed} mph<br>'
+    'Wind: {wind_speed} mph {wind_direction} | Ferry: {ferry_status}</p>'
+    '</div>'
+)
+
+def _window_cards(windows, color):
+    """Render launch windows as a row of colored cards in a single HTML block."""
+    cards = "".join(WINDOW_CARD_TEMPLATE.format(color=color, **window) for window in windows)
+    return f'<div style="display: flex; gap: 10px;">{cards}</div>'
+
+def _window_details(windows, color, background):
+    """Render launch windows as stacked detail cards in a single HTML block."""
+    return "".join(
+        WINDOW_DETAIL_TEMPLATE.format(color=color, background=background, **window)
+        for window in windows
+    )
+
+# Cache fetched data per date for an hour (matching the documented refresh rate)
+# so widget interactions and reruns don't repeat the API round-trips
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def _cached_all_data(date):
+    return get_all_data(date)
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def _cached_ferry_schedule(date):
+    return get_ferry_schedule(date)
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def _cached_sun_times(date):
+    return get_sun_times(date)
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def _cached_recommendation_frame(date):
+    tide_data, current_data, weather_data = _cached_all_data(date)
+    return get_launch_recommendation_frame(
+        tide_data, current_data, _cached_ferry_schedule(date), weather_data
+    )
+
+def _clear_cached_dates(dates):
+    """
+    Drop the cached data for some dates so the next run fetches it again
+    (failed fetches and simulated weather are cached like any other result)
+    
+    Args:
+        dates: Dates to refresh
+    """
+    clear_cached_dates(dates)
+    for date in dates:
+        _cached_all_data.clear(date)
+        _cached_ferry_schedule.clear(date)
+        _cached_recommendation_frame.clear(date)
+
+def _cached_recommendations(date):
+    return _cached_recommendation_frame(date).to_dict('records')
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
+def _weekly_rating_pivot(weekly_rec_df):
+    """
+    Pivot weekly recommendations into an hour x date grid of rating values
+    
+    Args:
+        weekly_rec_df: DataFrame with date, hour and rating_value columns
+        
+    Returns:
+        DataFrame indexed by hour with one column per date string
+    """
+    # Dates as an ordered categorical so the grid's columns stay in date order
+    date_str = pd.to_datetime(weekly_rec_df['date']).dt.strftime(DATE_FORMAT)
+    grid_df = weekly_rec_df.assign(
+        date_str=pd.Categorical(date_str, categories=date_str.unique())
+    )
+    
+    return grid_df.pivot_table(
+        index='hour',
+        columns='date_str',
+        values='rating_value',
+        aggfunc='first'
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
+def _weekly_tide_extremes(weekly_tide_df):
+    """
+    Find the high and low tides (local maxima/minima) for each day
+    
+    Args:
+        weekly_tide_df: DataFrame with date, time and height columns
+        
+    Returns:
+        DataFrame of extremes sorted by date and time, with display strings
+        (empty if none were found)
+    """
+    # Compare each interior reading to both neighbours at once
+    tide_extremes = []
+    for date, group in weekly_tide_df.groupby('date', sort=False):
+        heights = group['height'].to_numpy()
+        interior = group.iloc[1:-1]
+        is_high = (heights[1:-1] > heights[:-2]) & (heights[1:-1] > heights[2:])
+        is_low = (heights[1:-1] < heights[:-2]) & (heights[1:-1] < heights[2:])
+        
+        tide_extremes.append(interior.loc[is_high, ['date', 'time', 'height']].assign(type='High'))
+        tide_extremes.append(interior.loc[is_low, ['date', 'time', 'height']].assign(type='Low'))
+    
+    # Convert to DataFrame and sort
+    extremes_df = pd.concat(tide_extremes, ignore_index=True) if tide_extremes else pd.DataFrame()
+    if not extremes_df.empty:
+        extremes_df['date_str'] = pd.to_datetime(extremes_df['date']).dt.strftime(DATE_FORMAT)
+        extremes_df['time_str'] = extremes_df['time'].dt.strftime('%H:%M')
+        extremes_df = extremes_df.sort_values(['date', 'time'])
+    
+    return extremes_df
+
+# Chart builders are cached too, so reruns with unchanged data reuse the figures
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
+def _tide_chart(tide_data):
+    """Build the daily tide height chart with the limited-beach-access zone."""
+    fig = px.line(
+        tide_data, 
+        x='time', 
+        y='height', 
+        title="Tide Heights (ft)",
+        labels={"time": "Time", "height": "Height (ft)"}
+    )
+    
+    # Axis bounds for the danger zone shape and its label, computed once
+    time_min, time_max = tide_data['time'].agg(['min', 'max'])
+    mid_time = tide_data['time'].iat[len(tide_data)//2]
+    
+    # Add high tide danger zone
+    high_tide_threshold = 10.0  # Assuming beach disappears around 10ft tide
+    fig.add_shape(
+        type="rect",
+        x0=time_min,
+        x1=time_max,
+        y0=high_tide_threshold,
+        y1=max(tide_data['height'].max() + 1, high_tide_threshold + 2),
+        fillcolor="rgba(255, 0, 0, 0.2)",
+        line=dict(width=0),
+        layer="below"
+    )
+    fig.add_annotation(
+        x=mid_time,
+        y=high_tide_threshold + 0.5,
+        text="Beach Access Limited",
+        showarrow=False,
+        font=dict(color="red")
+    )
+    
+    # Improve appearance
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    
+    return fig
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
+def _current_chart(current_data):
+    """Build the daily current speed chart with the strong-current zone."""
+    fig = px.line(
+        current_data, 
+        x='time', 
+        y='speed', 
+        title="Current Speed (mph)",
+        labels={"time": "Time", "speed": "Speed (mph)"}
+    )
+    
+    # Axis bounds for the danger zone shape and its label, computed once
+    time_min, time_max = current_data['time'].agg(['min', 'max'])
+    mid_time = current_data['time'].iat[len(current_data)//2]
+    
+    # Add danger zone for strong currents
+    strong_current_threshold = 2.3  # mph (2.0 knots converted to mph)
+    fig.add_shape(
+        type="rect",
+        x0=time_min,
+        x1=time_max,
+        y0=strong_current_threshold,
+        y1=max(current_data['speed'].max() + 0.5, strong_current_threshold + 1),
+        fillcolor="rgba(255, 0, 0, 0.2)",
+        line=dict(width=0),
+        layer="below"
+    )
+    fig.add_annotation(
+        x=mid_time,
+        y=strong_current_threshold + 0.25,
+        text="Strong Current",
+        showarrow=False,
+        font=dict(color="red")
+    )
+    
+    # Improve appearance
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    
+    return fig
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
+def _rating_heatmap(pivot_df):
+    """Build the weekly launch quality heatmap from the hour x date rating grid."""
+    # Create custom colorscale
+    colors = [NOT_RECOMMENDED_COLOR, ACCEPTABLE_COLOR, OPTIMAL_COLOR]
+    colorscale = [[0, colors[0]], [0.5, colors[1]], [1, colors[2]]]
+    
+    # Hover text for every cell, built by broadcasting hour rows against
+    # date columns; missing cells use the extra 'No Data' label
+    rating_labels = np.array(['Not Recommended', 'Acceptable', 'Optimal', 'No Data'], dtype=object)
+    rating_codes = np.nan_to_num(pivot_df.to_numpy(dtype=float), nan=3).astype(int)
+    hover_text = (
+        'Hour: ' + pivot_df.index.astype(str).to_numpy(dtype=object)[:, None] +
+        ':00<br>Date: ' + pivot_df.columns.astype(str).to_numpy(dtype=object)[None, :] +
+        '<br>Rating: ' + rating_labels[rating_codes]
+    )
+    
+    # Create heatmap
+    fig = go.Figure(data=go.Heatmap(
+        z=pivot_df.values,
+        x=pivot_df.columns,
+        y=pivot_df.index,
+        colorscale=colorscale,
+        showscale=False,
+        hoverongaps=False,
+        text=hover_text,
+        hoverinfo="text"
+    ))
+    
+    # Customize layout
+    fig.update_layout(
+        title="Launch Quality by Day and Hour",
+        xaxis_title="Date",
+        yaxis_title="Hour",
+        height=500
+    )
+    
+    # Update y-axis to show hours in 24-hour format
+    fig.update_yaxes(
+        tickvals=list(range(0, 24)),
+        ticktext=[f"{h:02d}:00" for h in range(0, 24)]
+    )
+    
+    return fig
+
+def _current_banner(status_text, rating_color, current_time):
+    """Render the launch status banner for the current hour."""
+    st.markdown(f"""
+    <div style="padding: 20px; border-radius: 10px; background-color: {rating_color}; margin: 20px 0; text-align: center;">
+        <h2 style="margin:0; color: white;">{status_text}</h2>
+        <p style="margin:5px 0 0 0; color: white; font-size: 18px;">
+            Current Time: {current_time}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+def _launch_quality_tab(weekly_rec_df):
+    """Render the weekly Launch Quality tab (heatmap and best days)."""
+    if not weekly_rec_df.empty:
+        st.subheader("Launch Quality by Day and Hour")
+        
+        # Note about daylight hours
+        st.markdown("""
+        **Note:** Recommendations only show optimal times during daylight hours 
+        (30 minutes before sunrise to 30 minutes after sunset).
+        """)
+        
+        # Create pivot table for the heatmap (cached, so tab switches don't redo it)
+        pivot_df = _weekly_rating_pivot(weekly_rec_df[['date', 'hour', 'rating_value']])
+        
+        st.plotly_chart(_rating_heatmap(pivot_df), use_container_width=True)
+        
+        # Legend
+        st.markdown(f"""
+        **Legend:**
+        - <span style='color:{OPTIMAL_COLOR};'>■</span> Optimal
+        - <span style='color:{ACCEPTABLE_COLOR};'>■</span> Acceptable
+        - <span style='color:{NOT_RECOMMENDED_COLOR};'>■</span> Not Recommended
+        """, unsafe_allow_html=True)
+        
+        # Best days summary
+        st.subheader("Best Days This Week")
+        is_optimal = weekly_rec_df['rating'].eq('optimal')
+        daily_quality = is_optimal.groupby(weekly_rec_df['date']).sum().rename('optimal_hours').reset_index()
+        daily_quality = daily_quality.sort_values('optimal_hours', ascending=False)
+        
+        if not daily_quality.empty:
+            # Display top 3 days with most optimal hours
+            for i, row in daily_quality.head(3).iterrows():
+                st.markdown(f"""
+                <div style="padding: 10px; border-radius: 5px; background-color: rgba(46, 204, 113, 0.1); margin-bottom: 10px;">
+                    <h4 style="margin:0;">{format_date(row['date'])}: {row['optimal_hours']} optimal hours</h4>
+                </div>
+                """, unsafe_allow_html=True)
+        else:
+            st.info("No optimal launch windows found for the selected week.")
+    else:
+        st.error("Weekly recommendation data not available")
+
+def _tide_overview_tab(weekly_tide_df):
+    """Render the weekly Tide Overview tab (tide chart and high/low table)."""
+    if not weekly_tide_df.empty:
+        st.subheader("Weekly Tide Overview")
+        
+        # Convert date to string for the legend
+        weekly_tide_df['date_str'] = pd.to_datetime(weekly_tide_df['date']).dt.strftime(DATE_FORMAT)
+        
+        # Create line chart for each day
+        fig = px.line(
+            weekly_tide_df,
+            x='time',
+            y='height',
+            color='date_str',
+            title="Tide Heights by Day (ft)",
+            labels={"time": "Time", "height": "Height (ft)", "date_str": "Date"}
+        )
+        
+        # Axis bounds for the danger zone shape and its label, computed once
+        time_min, time_max = weekly_tide_df['time'].agg(['min', 'max'])
+        mid_time = weekly_tide_df['time'].iat[len(weekly_tide_df)//2]
+        
+        # Add high tide danger zone
+        high_tide_threshold = 10.0  # Assuming beach disappears around 10ft tide
+        fig.add_shape(
+            type="rect",
+            x0=time_min,
+            x1=time_max,
+            y0=high_tide_threshold,
+            y1=max(weekly_tide_df['height'].max() + 1, high_tide_threshold + 2),
+            fillcolor="rgba(255, 0, 0, 0.2)",
+            line=dict(width=0),
+            layer="below"
+        )
+        fig.add_annotation(
+            x=mid_time,
+            y=high_tide_threshold + 0.5,
+            text="Beach Access Limited",
+            showarrow=False,
+            font=dict(color="red")
+        )
+        
+        # Improve appearance
+        fig.update_layout(
+            height=500,
+            margin=dict(l=20, r=20, t=40, b=20)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Show high and low tide times for each day
+        st.subheader("High & Low Tides")
+        
+        # Group by date and find high/low points (cached alongside the pivot)
+        extremes_df = _weekly_tide_extremes(weekly_tide_df[['date', 'time', 'height']])
+        if not extremes_df.empty:
+            # Display as a table
+            display_df = extremes_df[['date_str', 'time_str', 'type', 'height']]
+            display_df.columns = ['Date', 'Time', 'Tide Type', 'Height (ft)']
+            
+            # Custom styling for high/low tides, a whole column at a time
+            def highlight_tide(col):
+                return np.select(
+                    [col.eq('High'), col.eq('Low')],
+                    ['background-color: #ffdddd', 'background-color: #ddffdd'],
+                    default=''
+                )
+            
+            styled_extremes = display_df.style.apply(
+                highlight_tide, subset=['Tide Type']
+            )
+            
+            st.dataframe(styled_extremes, use_container_width=True)
+        else:
+            st.info("Could not determine tide extremes from the available data.")
+    else:
+        st.error("Weekly tide data not available")
+
+def _weather_trends_tab(weekly_rec_df):
+    """Render the weekly Weather Trends tab (wind chart and summary)."""
+    if not weekly_rec_df.empty:
+        st.subheader("Weekly Weather Overview")
+        
+        # Extract weather data from recommendations (wind speed is stored
+        # formatted for display, so turn it back into a number for charting)
+        weather_df = weekly_rec_df[['date', 'hour', 'wind_speed', 'wind_direction']].astype({'wind_speed': float})
+        weather_df['date_str'] = pd.to_datetime(weather_df['date']).dt.strftime(DATE_FORMAT)
+        
+        # Chart points in time order per day; if the data ever gets dense (e.g.
+        # finer forecast intervals) keep only the visually significant points
+        chart_df = weather_df.sort_values(['date', 'hour'])
+        if len(chart_df) > MAX_CHART_POINTS:
+            points_per_day = MAX_CHART_POINTS // chart_df['date'].nunique()
+            chart_df = pd.concat([
+                group.iloc[lttb_indices(group['hour'], group['wind_speed'], points_per_day)]
+                for _, group in chart_df.groupby('date', sort=False)
+            ])
+        
+        # Create line chart for wind speed
+        fig = px.line(
+            chart_df,
+            x='hour',
+            y='wind_speed',
+            color='date_str',
+            title="Wind Speed by Day (mph)",
+            labels={"hour": "Hour", "wind_speed": "Wind Speed (mph)", "date_str": "Date"},
+            render_mode="webgl"  # WebGL keeps rendering fast as the number of points grows
+        )
+        
+        # Axis bounds for the danger zone shape and its label, computed once
+        hour_min, hour_max = chart_df['hour'].agg(['min', 'max'])
+        mid_hour = chart_df['hour'].iat[len(chart_df)//2]
+        
+        # Add danger zone for strong winds
+        strong_wind_threshold = 15.0  # mph
+        fig.add_shape(
+            type="rect",
+            x0=hour_min,
+            x1=hour_max,
+            y0=strong_wind_threshold,
+            y1=max(weather_df['wind_speed'].max() + 2, strong_wind_threshold + 5),
+            fillcolor="rgba(255, 0, 0, 0.2)",
+            line=dict(width=0),
+            layer="below"
+        )
+        fig.add_annotation(
+            x=mid_hour,
+            y=strong_wind_threshold + 2,
+            text="Strong Winds",
+            showarrow=False,
+            font=dict(color="red")
+        )
+        
+        # Update x-axis to show hours in 24-hour format
+        fig.update_xaxes(
+            tickvals=list(range(0, 24)),
+            ticktext=[f"{h:02d}:00" for h in range(0, 24)]
+        )
+        
+        # Improve appearance
+        fig.update_layout(
+            height=400,
+            margin=dict(l=20, r=20, t=40, b=20)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Wind direction summary
+        st.subheader("Wind Direction Summary")
+        
+        # Average/max wind speed for each day
+        wind_summary_df = weather_df.groupby('date').agg(
+            avg_speed=('wind_speed', 'mean'),
+            max_speed=('wind_speed', 'max')
+        )
+        
+        # Predominant (most frequent) wind direction for each day; ties go to
+        # the direction seen first, as with value_counts
+        predominant_direction = (
+            weather_df.groupby(['date', 'wind_direction'], sort=False, observed=True).size()
+            .sort_values(ascending=False, kind='stable')
+            .reset_index()
+            .drop_duplicates('date')
+            .set_index('date')['wind_direction']
+        )
+        wind_summary_df['predominant_direction'] = predominant_direction
+        wind_summary_df['date_str'] = pd.to_datetime(wind_summary_df.index).strftime(DATE_FORMAT)
+        wind_summary_df = wind_summary_df.reset_index()
+        
+        # Display as a table
+        if not wind_summary_df.empty:
+            display_df = wind_summary_df[['date_str', 'predominant_direction', 'avg_speed', 'max_speed']]
+            display_df.columns = ['Date', 'Predominant Direction', 'Avg Speed (mph)', 'Max Speed (mph)']
+            
+            # Custom styling for wind speed, a whole column at a time
+            def color_wind_speed(col):
+                return np.select(
+                    [col > 15, col > 10],
+                    ['color: red', 'color: orange'],
+                    default=''
+                )
+            
+            styled_wind = display_df.style.apply(
+                color_wind_speed, subset=['Avg Speed (mph)', 'Max Speed (mph)']
+            )
+            
+            st.dataframe(styled_wind, use_container_width=True)
+        else:
+            st.info("Could not determine wind patterns from the available data.")
+    else:
+        st.error("Weekly weather data not available")
+
+def _fetch_day(date):
+    """Fetch (tide, current, recommendation frame) for one date through the caches."""
+    tide_data, current_data, _ = _cached_all_data(date)
+    return tide_data, current_data, _cached_recommendation_frame(date)
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=8)
+def _build_weekly(dates):
+    """
+    Fetch and assemble the weekly overview frames
+    
+    Args:
+        dates: Tuple of dates in the week
+        
+    Returns:
+        Tuple of (weekly_tide_df, weekly_current_df, weekly_rec_df)
+    """
+    # Prepare containers for weekly data
+    weekly_tide_data = []
+    weekly_current_data = []
+    weekly_recommendation_frames = []
+    
+    # Fetch every day of the week concurrently; worker threads get the
+    # script context so the st.cache_data lookups behave as on the main thread
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=len(dates),
+        initializer=add_script_run_ctx,
+        initargs=(None, ctx)
+    ) as executor:
+        daily_data = list(executor.map(_fetch_day, dates))
+    
+    for date, (tide_data, current_data, daily_recommendations) in zip(dates, daily_data):
+        # Store tide and current data for weekly overview
+        if tide_data is not None:
+            weekly_tide_data.append(tide_data.assign(date=date))
+        
+        if current_data is not None:
+            weekly_current_data.append(current_data.assign(date=date))
+        
+        if not daily_recommendations.empty:
+            weekly_recommendation_frames.append(daily_recommendations.assign(date=date))
+    
+    # Combine weekly data
+    if weekly_tide_data:
+        weekly_tide_df = pd.concat(weekly_tide_data, ignore_index=True)
+    else:
+        weekly_tide_df = pd.DataFrame()
+    
+    if weekly_current_data:
+        weekly_current_df = pd.concat(weekly_current_data, ignore_index=True)
+    else:
+        weekly_current_df = pd.DataFrame()
+    
+    if weekly_recommendation_frames:
+        weekly_rec_df = pd.concat(weekly_recommendation_frames, ignore_index=True)
+        
+        # Ordered categorical rating whose codes double as the heatmap value
+        # (not_recommended=0, acceptable=1, optimal=2), and a small int hour
+        weekly_rec_df['rating'] = pd.Categorical(
+            weekly_rec_df['rating'], categories=RATING_LEVELS, ordered=True
+        )
+        weekly_rec_df['rating_value'] = weekly_rec_df['rating'].cat.codes.astype('int8')
+        weekly_rec_df['hour'] = weekly_rec_df['hour'].astype('int8')
+    else:
+        weekly_rec_df = pd.DataFrame()
+    
+    return weekly_tide_df, weekly_current_df, weekly_rec_df
+
 # Configure page
 st.set_page_config(
     page_title="Bainbridge Island Kayak Launch Assistant",
@@ -36,12 +616,15 @@ This application provides recommendations for kayak launches from Point White Dr
 Recommendations are based on tide levels, current speed, ferry schedules, and wind conditions.
 """)
 
+# Current Pacific time, read once per run and shared by everything below
+now = get_pacific_time()
+
 # Sidebar for date selection
 with st.sidebar:
     st.header("Settings")
     
     # Date selection
-    today = get_pacific_time().date()
+    today = now.date()
     
     # Custom date selector with US format
     st.markdown("**Select date**")
@@ -51,11 +634,15 @@ with st.sidebar:
                         index=today.month-1,
                         key="month_select")
     
+    # Only offer days that exist in the chosen month. The year selectbox is
+    # drawn below the day, so read its current value from session state.
+    year = st.session_state.get("year_select", today.year)
+    days_in_month = calendar.monthrange(year, month)[1]
     day = st.selectbox("Day", 
-                      options=range(1, 32),
+                      options=range(1, days_in_month + 1),
                       format_func=lambda x: f"{x:02d}",
-                      index=today.day-1,
-                      key="day_select")
+                      index=min(today.day, days_in_month) - 1,
+                      key=f"day_select_{year}_{month}")
     
     year = st.selectbox("Year", 
                        options=[today.year, today.year + 1],
@@ -63,26 +650,21 @@ with st.sidebar:
                        key="year_select")
     
     # Create date object from selections
-    try:
-        selected_date = datetime(year, month, day).date()
-        # Ensure selected date is not before today
-        if selected_date < today:
-            selected_date = today
-        # Ensure selected date is not more than 7 days in the future
-        max_date = today + timedelta(days=7)
-        if selected_date > max_date:
-            selected_date = max_date
-        
-        st.markdown(f"**Selected: {format_date(selected_date)}**")
-        
-        # Add refresh button
-        if st.button("Refresh Data for Selected Date", key="refresh_button"):
-            st.rerun()
-            
-    except ValueError:
-        # Handle invalid dates like Feb 31
-        st.warning("Invalid date selection. Using today's date.")
+    selected_date = datetime(year, month, day).date()
+    # Ensure selected date is not before today
+    if selected_date < today:
         selected_date = today
+    # Ensure selected date is not more than 7 days in the future
+    max_date = today + timedelta(days=7)
+    if selected_date > max_date:
+        selected_date = max_date
+    
+    st.markdown(f"**Selected: {format_date(selected_date)}**")
+    
+    # Add refresh button
+    if st.button("Refresh Data for Selected Date", key="refresh_button"):
+        _clear_cached_dates([selected_date])
+        st.rerun()
     
     # View options
     view_option = st.radio(
@@ -130,14 +712,11 @@ if view_option == "Daily Forecast":
     # Try to load data with error handling
     with st.spinner("Fetching data..."):
         try:
-            # Get data from APIs
-            tide_data = get_tide_data(selected_date)
-            current_data = get_current_data(selected_date)
-            ferry_data = get_ferry_schedule(selected_date)
-            weather_data = get_weather_data(selected_date)
+            # Get data from APIs (tide, current and weather are fetched concurrently)
+            tide_data, current_data, _ = _cached_all_data(selected_date)
             
             # Get sunrise and sunset times
-            sun_times = get_sun_times(selected_date)
+            sun_times = _cached_sun_times(selected_date)
             sunrise_time = format_time(sun_times['sunrise'])
             sunset_time = format_time(sun_times['sunset'])
             
@@ -149,9 +728,11 @@ if view_option == "Daily Forecast":
             """)
             
             # Get recommendations based on all conditions
-            recommendations = get_launch_recommendations(
-                tide_data, current_data, ferry_data, weather_data
-            )
+            recommendations = _cached_recommendations(selected_date)
+            
+            # Index recommendations by hour so the current hour is a direct lookup
+            by_hour = {r['hour']: r for r in recommendations}
+            current_conditions = by_hour.get(now.hour)
             
             # SIMPLIFIED VIEW: Start with clean display of ideal launch times
             if recommendations:
@@ -159,61 +740,21 @@ if view_option == "Daily Forecast":
                 optimal_windows = [r for r in recommendations if r['rating'] == 'optimal']
                 acceptable_windows = [r for r in recommendations if r['rating'] == 'acceptable']
                 
-                # Current conditions
-                current_hour = get_pacific_time().hour
-                current_conditions = None
-                
-                for r in recommendations:
-                    start_hour = int(r['start_time'].split(':')[0])
-                    if start_hour <= current_hour < start_hour + 1:
-                        current_conditions = r
-                        break
-                
                 # Show current status first
                 if current_conditions:
-                    rating_color = {
-                        'optimal': OPTIMAL_COLOR,
-                        'acceptable': ACCEPTABLE_COLOR,
-                        'not_recommended': NOT_RECOMMENDED_COLOR
-                    }[current_conditions['rating']]
-                    
-                    status_text = "OPTIMAL TIME TO LAUNCH! 🚣" if current_conditions['rating'] == 'optimal' else \
-                                "ACCEPTABLE TO LAUNCH" if current_conditions['rating'] == 'acceptable' else \
-                                "NOT RECOMMENDED FOR LAUNCH"
-                    
-                    st.markdown(f"""
-                    <div style="padding: 20px; border-radius: 10px; background-color: {rating_color}; margin: 20px 0; text-align: center;">
-                        <h2 style="margin:0; color: white;">{status_text}</h2>
-                        <p style="margin:5px 0 0 0; color: white; font-size: 18px;">
-                            Current Time: {get_pacific_time().strftime('%H:%M')}
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    rating_color, status_text = RATING_META[current_conditions['rating']]
+                    _current_banner(status_text, rating_color, now.strftime('%H:%M'))
                 
                 # Display optimal windows prominently
                 st.subheader("Today's Optimal Launch Windows")
                 if optimal_windows:
                     # Create a more visually prominent display of optimal times
-                    cols = st.columns(min(3, len(optimal_windows)))
-                    for i, window in enumerate(optimal_windows[:3]):
-                        with cols[i]:
-                            st.markdown(f"""
-                            <div style="padding: 15px; border-radius: 10px; background-color: {OPTIMAL_COLOR}; text-align: center;">
-                                <h3 style="margin:0; color: white;">{window['start_time']} - {window['end_time']}</h3>
-                            </div>
-                            """, unsafe_allow_html=True)
+                    st.markdown(_window_cards(optimal_windows[:3], OPTIMAL_COLOR), unsafe_allow_html=True)
                 else:
                     st.info("No optimal launch windows available today.")
                     if acceptable_windows:
                         st.subheader("Best Alternatives")
-                        cols = st.columns(min(3, len(acceptable_windows)))
-                        for i, window in enumerate(acceptable_windows[:3]):
-                            with cols[i]:
-                                st.markdown(f"""
-                                <div style="padding: 15px; border-radius: 10px; background-color: {ACCEPTABLE_COLOR}; text-align: center;">
-                                    <h3 style="margin:0; color: white;">{window['start_time']} - {window['end_time']}</h3>
-                                </div>
-                                """, unsafe_allow_html=True)
+                        st.markdown(_window_cards(acceptable_windows[:3], ACCEPTABLE_COLOR), unsafe_allow_html=True)
                     else:
                         st.error("No suitable launch windows available today. Consider another day.")
             else:
@@ -245,135 +786,54 @@ if view_option == "Daily Forecast":
                     # Top recommendations 
                     st.subheader("Top Launch Windows")
                     if optimal_windows:
-                        for window in optimal_windows[:3]:  # Show top 3 optimal windows
-                            st.markdown(f"""
-                            <div style="padding: 10px; border-radius: 5px; background-color: rgba(46, 204, 113, 0.1); margin-bottom: 10px;">
-                                <h4 style="margin:0; color: {OPTIMAL_COLOR};">🚣 {window['start_time']} - {window['end_time']}</h4>
-                                <p style="margin:0;">Tide: {window['tide_height']}ft | Current: {window['current_speed']} mph<br>
-                                Wind: {window['wind_speed']} mph {window['wind_direction']} | Ferry: {window['ferry_status']}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                        # Show top 3 optimal windows
+                        st.markdown(_window_details(optimal_windows[:3], OPTIMAL_COLOR, "rgba(46, 204, 113, 0.1)"), unsafe_allow_html=True)
                     elif acceptable_windows:
-                        for window in acceptable_windows[:3]:
-                            st.markdown(f"""
-                            <div style="padding: 10px; border-radius: 5px; background-color: rgba(241, 196, 15, 0.1); margin-bottom: 10px;">
-                                <h4 style="margin:0; color: {ACCEPTABLE_COLOR};">🚣 {window['start_time']} - {window['end_time']}</h4>
-                                <p style="margin:0;">Tide: {window['tide_height']}ft | Current: {window['current_speed']} mph<br>
-                                Wind: {window['wind_speed']} mph {window['wind_direction']} | Ferry: {window['ferry_status']}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                        st.markdown(_window_details(acceptable_windows[:3], ACCEPTABLE_COLOR, "rgba(241, 196, 15, 0.1)"), unsafe_allow_html=True)
                 
                 # Visualizations
                 with col2:
                     # Create tide chart
                     st.subheader("Tide Forecast")
                     if tide_data is not None and len(tide_data) > 0:
-                        fig = px.line(
-                            tide_data, 
-                            x='time', 
-                            y='height', 
-                            title="Tide Heights (ft)",
-                            labels={"time": "Time", "height": "Height (ft)"}
-                        )
-                        
-                        # Add high tide danger zone
-                        high_tide_threshold = 10.0  # Assuming beach disappears around 10ft tide
-                        fig.add_shape(
-                            type="rect",
-                            x0=tide_data['time'].min(),
-                            x1=tide_data['time'].max(),
-                            y0=high_tide_threshold,
-                            y1=max(tide_data['height'].max() + 1, high_tide_threshold + 2),
-                            fillcolor="rgba(255, 0, 0, 0.2)",
-                            line=dict(width=0),
-                            layer="below"
-                        )
-                        fig.add_annotation(
-                            x=tide_data['time'].iloc[len(tide_data)//2],
-                            y=high_tide_threshold + 0.5,
-                            text="Beach Access Limited",
-                            showarrow=False,
-                            font=dict(color="red")
-                        )
-                        
-                        # Improve appearance
-                        fig.update_layout(
-                            height=300,
-                            margin=dict(l=20, r=20, t=40, b=20)
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(_tide_chart(tide_data), use_container_width=True)
                     else:
                         st.error("Tide data not available")
                     
                     # Create current chart
                     st.subheader("Current Forecast")
                     if current_data is not None and len(current_data) > 0:
-                        fig = px.line(
-                            current_data, 
-                            x='time', 
-                            y='speed', 
-                            title="Current Speed (mph)",
-                            labels={"time": "Time", "speed": "Speed (mph)"}
-                        )
-                        
-                        # Add danger zone for strong currents
-                        strong_current_threshold = 2.3  # mph (2.0 knots converted to mph)
-                        fig.add_shape(
-                            type="rect",
-                            x0=current_data['time'].min(),
-                            x1=current_data['time'].max(),
-                            y0=strong_current_threshold,
-                            y1=max(current_data['speed'].max() + 0.5, strong_current_threshold + 1),
-                            fillcolor="rgba(255, 0, 0, 0.2)",
-                            line=dict(width=0),
-                            layer="below"
-                        )
-                        fig.add_annotation(
-                            x=current_data['time'].iloc[len(current_data)//2],
-                            y=strong_current_threshold + 0.25,
-                            text="Strong Current",
-                            showarrow=False,
-                            font=dict(color="red")
-                        )
-                        
-                        # Improve appearance
-                        fig.update_layout(
-                            height=300,
-                            margin=dict(l=20, r=20, t=40, b=20)
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(_current_chart(current_data), use_container_width=True)
                     else:
                         st.error("Current data not available")
             
             # Display hourly forecast in a table
             st.subheader("All Hours Forecast")
             if recommendations:
-                # Create summary hourly table
-                hours = []
-                for r in recommendations:
-                    start_hour = int(r['start_time'].split(':')[0])
-                    hours.append({
-                        'Hour': f"{start_hour:02d}:00 - {start_hour+1:02d}:00",
-                        'Rating': r['rating'].title(),
-                        'Tide': f"{r['tide_height']}ft ({r['tide_status']})",
-                        'Current': f"{r['current_speed']} mph ({r['current_direction']})",
-                        'Wind': f"{r['wind_speed']} mph ({r['wind_direction']})",
-                        'Ferry': r['ferry_status']
-                    })
-                
-                # Create DataFrame for the table
-                hourly_df = pd.DataFrame(hours)
+                # Create summary hourly table, building each display column in one pass
+                rec_df = pd.DataFrame(recommendations)
+                hourly_df = pd.DataFrame({
+                    'Hour': rec_df['start_time'] + ' - ' + rec_df['end_time'],
+                    'Rating': rec_df['rating'].str.replace('_', ' ').str.title(),
+                    'Tide': rec_df['tide_height'] + 'ft (' + rec_df['tide_status'] + ')',
+                    'Current': rec_df['current_speed'] + ' mph (' + rec_df['current_direction'] + ')',
+                    'Wind': rec_df['wind_speed'] + ' mph (' + rec_df['wind_direction'] + ')',
+                    'Ferry': rec_df['ferry_status']
+                })
                 
                 # Create styled table with colors based on rating
-                def color_rating(val):
-                    color_map = {
-                        'Optimal': f'background-color: {OPTIMAL_COLOR}; color: white',
-                        'Acceptable': f'background-color: {ACCEPTABLE_COLOR}; color: white',
-                        'Not Recommended': f'background-color: {NOT_RECOMMENDED_COLOR}; color: white'
-                    }
-                    return color_map.get(val, '')
+                def color_rating(col):
+                    return np.select(
+                        [col.eq('Optimal'), col.eq('Acceptable'), col.eq('Not Recommended')],
+                        [
+                            f'background-color: {OPTIMAL_COLOR}; color: white',
+                            f'background-color: {ACCEPTABLE_COLOR}; color: white',
+                            f'background-color: {NOT_RECOMMENDED_COLOR}; color: white'
+                        ],
+                        default=''
+                    )
                 
-                styled_hourly = hourly_df.style.map(
+                styled_hourly = hourly_df.style.apply(
                     color_rating, subset=['Rating']
                 )
                 
@@ -502,6 +962,8 @@ else:  # Weekly Overview
     
     # Add refresh button for weekly view
     if st.button("Refresh Weekly Data", key="refresh_weekly_button"):
+        _clear_cached_dates(dates_to_fetch)
+        _build_weekly.clear(tuple(dates_to_fetch))
         st.rerun()
     
     # Create tabs for different aspects
@@ -510,361 +972,20 @@ else:  # Weekly Overview
     # Try to load data for the week
     with st.spinner("Fetching weekly data..."):
         try:
-            # Prepare containers for weekly data
-            weekly_tide_data = []
-            weekly_current_data = []
-            weekly_recommendations = []
-            
-            # Fetch data for each day in the week
-            for date in dates_to_fetch:
-                # Get data from APIs for this date
-                tide_data = get_tide_data(date)
-                current_data = get_current_data(date)
-                ferry_data = get_ferry_schedule(date)
-                weather_data = get_weather_data(date)
-                
-                # Get sunrise and sunset times for this date
-                sun_times = get_sun_times(date)
-                
-                # Store tide and current data for weekly overview
-                if tide_data is not None:
-                    tide_data['date'] = date
-                    weekly_tide_data.append(tide_data)
-                
-                if current_data is not None:
-                    current_data['date'] = date
-                    weekly_current_data.append(current_data)
-                
-                # Get daily recommendations
-                daily_recommendations = get_launch_recommendations(
-                    tide_data, current_data, ferry_data, weather_data
-                )
-                
-                # Add date to each recommendation
-                for rec in daily_recommendations:
-                    rec['date'] = date
-                
-                weekly_recommendations.extend(daily_recommendations)
-            
-            # Combine weekly data
-            if weekly_tide_data:
-                weekly_tide_df = pd.concat(weekly_tide_data)
-            else:
-                weekly_tide_df = pd.DataFrame()
-                
-            if weekly_current_data:
-                weekly_current_df = pd.concat(weekly_current_data)
-            else:
-                weekly_current_df = pd.DataFrame()
-                
-            weekly_rec_df = pd.DataFrame(weekly_recommendations)
+            # Fetch and assemble the whole week in one cached call
+            weekly_tide_df, weekly_current_df, weekly_rec_df = _build_weekly(tuple(dates_to_fetch))
             
             # Tab 1: Launch Quality Heatmap
             with tab1:
-                if not weekly_rec_df.empty:
-                    st.subheader("Launch Quality by Day and Hour")
-                    
-                    # Note about daylight hours
-                    st.markdown("""
-                    **Note:** Recommendations only show optimal times during daylight hours 
-                    (30 minutes before sunrise to 30 minutes after sunset).
-                    """)
-                    
-                    # Prepare data for heatmap
-                    # Convert date to string for display
-                    weekly_rec_df['date_str'] = weekly_rec_df['date'].apply(lambda d: format_date(d))
-                    
-                    # Extract hour from time
-                    weekly_rec_df['hour'] = weekly_rec_df['start_time'].apply(
-                        lambda t: int(t.split(':')[0])
-                    )
-                    
-                    # Create a pivot table for the heatmap
-                    # Map ratings to numerical values: optimal=2, acceptable=1, not_recommended=0
-                    rating_map = {
-                        'optimal': 2,
-                        'acceptable': 1,
-                        'not_recommended': 0
-                    }
-                    weekly_rec_df['rating_value'] = weekly_rec_df['rating'].map(rating_map)
-                    
-                    # Create pivot table
-                    pivot_df = weekly_rec_df.pivot_table(
-                        index='hour',
-                        columns='date_str',
-                        values='rating_value',
-                        aggfunc='first'
-                    )
-                    
-                    # Create custom colorscale
-                    colors = [NOT_RECOMMENDED_COLOR, ACCEPTABLE_COLOR, OPTIMAL_COLOR]
-                    colorscale = [[0, colors[0]], [0.5, colors[1]], [1, colors[2]]]
-                    
-                    # Create heatmap
-                    fig = go.Figure(data=go.Heatmap(
-                        z=pivot_df.values,
-                        x=pivot_df.columns,
-                        y=pivot_df.index,
-                        colorscale=colorscale,
-                        showscale=False,
-                        hoverongaps=False,
-                        text=[[
-                            f"Hour: {hour}:00<br>Date: {date}<br>Rating: {['Not Recommended', 'Acceptable', 'Optimal'][int(rating)] if not pd.isna(rating) else 'No Data'}"
-                            for date, rating in zip(pivot_df.columns, row)
-                        ] for hour, row in zip(pivot_df.index, pivot_df.values)],
-                        hoverinfo="text"
-                    ))
-                    
-                    # Customize layout
-                    fig.update_layout(
-                        title="Launch Quality by Day and Hour",
-                        xaxis_title="Date",
-                        yaxis_title="Hour",
-                        height=500
-                    )
-                    
-                    # Update y-axis to show hours in 24-hour format
-                    fig.update_yaxes(
-                        tickvals=list(range(0, 24)),
-                        ticktext=[f"{h:02d}:00" for h in range(0, 24)]
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Legend
-                    st.markdown(f"""
-                    **Legend:**
-                    - <span style='color:{OPTIMAL_COLOR};'>■</span> Optimal
-                    - <span style='color:{ACCEPTABLE_COLOR};'>■</span> Acceptable
-                    - <span style='color:{NOT_RECOMMENDED_COLOR};'>■</span> Not Recommended
-                    """, unsafe_allow_html=True)
-                    
-                    # Best days summary
-                    st.subheader("Best Days This Week")
-                    daily_quality = weekly_rec_df.groupby('date').apply(
-                        lambda x: (x['rating'] == 'optimal').sum()
-                    ).reset_index()
-                    daily_quality.columns = ['date', 'optimal_hours']
-                    daily_quality = daily_quality.sort_values('optimal_hours', ascending=False)
-                    
-                    if not daily_quality.empty:
-                        # Display top 3 days with most optimal hours
-                        for i, row in daily_quality.head(3).iterrows():
-                            st.markdown(f"""
-                            <div style="padding: 10px; border-radius: 5px; background-color: rgba(46, 204, 113, 0.1); margin-bottom: 10px;">
-                                <h4 style="margin:0;">{format_date(row['date'])}: {row['optimal_hours']} optimal hours</h4>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    else:
-                        st.info("No optimal launch windows found for the selected week.")
-                else:
-                    st.error("Weekly recommendation data not available")
+                _launch_quality_tab(weekly_rec_df)
             
             # Tab 2: Tide Overview
             with tab2:
-                if not weekly_tide_df.empty:
-                    st.subheader("Weekly Tide Overview")
-                    
-                    # Convert datetime to string for readability
-                    weekly_tide_df['date_str'] = weekly_tide_df['date'].apply(lambda d: format_date(d))
-                    weekly_tide_df['time_str'] = weekly_tide_df['time'].apply(
-                        lambda t: t.strftime('%H:%M')
-                    )
-                    
-                    # Create line chart for each day
-                    fig = px.line(
-                        weekly_tide_df,
-                        x='time',
-                        y='height',
-                        color='date_str',
-                        title="Tide Heights by Day (ft)",
-                        labels={"time": "Time", "height": "Height (ft)", "date_str": "Date"}
-                    )
-                    
-                    # Add high tide danger zone
-                    high_tide_threshold = 10.0  # Assuming beach disappears around 10ft tide
-                    fig.add_shape(
-                        type="rect",
-                        x0=weekly_tide_df['time'].min(),
-                        x1=weekly_tide_df['time'].max(),
-                        y0=high_tide_threshold,
-                        y1=max(weekly_tide_df['height'].max() + 1, high_tide_threshold + 2),
-                        fillcolor="rgba(255, 0, 0, 0.2)",
-                        line=dict(width=0),
-                        layer="below"
-                    )
-                    fig.add_annotation(
-                        x=weekly_tide_df['time'].iloc[len(weekly_tide_df)//2],
-                        y=high_tide_threshold + 0.5,
-                        text="Beach Access Limited",
-                        showarrow=False,
-                        font=dict(color="red")
-                    )
-                    
-                    # Improve appearance
-                    fig.update_layout(
-                        height=500,
-                        margin=dict(l=20, r=20, t=40, b=20)
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Show high and low tide times for each day
-                    st.subheader("High & Low Tides")
-                    
-                    # Group by date and find high/low points
-                    tide_extremes = []
-                    for date, group in weekly_tide_df.groupby('date'):
-                        # Find high tides (local maxima)
-                        high_tides = []
-                        for i in range(1, len(group) - 1):
-                            if group.iloc[i]['height'] > group.iloc[i-1]['height'] and group.iloc[i]['height'] > group.iloc[i+1]['height']:
-                                high_tides.append({
-                                    'date': date,
-                                    'time': group.iloc[i]['time'],
-                                    'height': group.iloc[i]['height'],
-                                    'type': 'High'
-                                })
-                        
-                        # Find low tides (local minima)
-                        low_tides = []
-                        for i in range(1, len(group) - 1):
-                            if group.iloc[i]['height'] < group.iloc[i-1]['height'] and group.iloc[i]['height'] < group.iloc[i+1]['height']:
-                                low_tides.append({
-                                    'date': date,
-                                    'time': group.iloc[i]['time'],
-                                    'height': group.iloc[i]['height'],
-                                    'type': 'Low'
-                                })
-                        
-                        tide_extremes.extend(high_tides)
-                        tide_extremes.extend(low_tides)
-                    
-                    # Convert to DataFrame and sort
-                    extremes_df = pd.DataFrame(tide_extremes)
-                    if not extremes_df.empty:
-                        extremes_df['date_str'] = extremes_df['date'].apply(lambda d: format_date(d))
-                        extremes_df['time_str'] = extremes_df['time'].apply(lambda t: t.strftime('%H:%M'))
-                        extremes_df = extremes_df.sort_values(['date', 'time'])
-                        
-                        # Display as a table
-                        display_df = extremes_df[['date_str', 'time_str', 'type', 'height']]
-                        display_df.columns = ['Date', 'Time', 'Tide Type', 'Height (ft)']
-                        
-                        # Custom styling for high/low tides
-                        def highlight_tide(val):
-                            if val == 'High':
-                                return 'background-color: #ffdddd'
-                            elif val == 'Low':
-                                return 'background-color: #ddffdd'
-                            return ''
-                        
-                        styled_extremes = display_df.style.map(
-                            highlight_tide, subset=['Tide Type']
-                        )
-                        
-                        st.dataframe(styled_extremes, use_container_width=True)
-                    else:
-                        st.info("Could not determine tide extremes from the available data.")
-                else:
-                    st.error("Weekly tide data not available")
+                _tide_overview_tab(weekly_tide_df)
             
             # Tab 3: Weather Trends
             with tab3:
-                if not weekly_rec_df.empty:
-                    st.subheader("Weekly Weather Overview")
-                    
-                    # Extract weather data from recommendations
-                    weather_df = weekly_rec_df[['date', 'hour', 'wind_speed', 'wind_direction']]
-                    weather_df['date_str'] = weather_df['date'].apply(lambda d: format_date(d))
-                    
-                    # Create line chart for wind speed
-                    fig = px.line(
-                        weather_df,
-                        x='hour',
-                        y='wind_speed',
-                        color='date_str',
-                        title="Wind Speed by Day (mph)",
-                        labels={"hour": "Hour", "wind_speed": "Wind Speed (mph)", "date_str": "Date"}
-                    )
-                    
-                    # Add danger zone for strong winds
-                    strong_wind_threshold = 15.0  # mph
-                    fig.add_shape(
-                        type="rect",
-                        x0=weather_df['hour'].min(),
-                        x1=weather_df['hour'].max(),
-                        y0=strong_wind_threshold,
-                        y1=max(weather_df['wind_speed'].max() + 2, strong_wind_threshold + 5),
-                        fillcolor="rgba(255, 0, 0, 0.2)",
-                        line=dict(width=0),
-                        layer="below"
-                    )
-                    fig.add_annotation(
-                        x=weather_df['hour'].iloc[len(weather_df)//2],
-                        y=strong_wind_threshold + 2,
-                        text="Strong Winds",
-                        showarrow=False,
-                        font=dict(color="red")
-                    )
-                    
-                    # Update x-axis to show hours in 24-hour format
-                    fig.update_xaxes(
-                        tickvals=list(range(0, 24)),
-                        ticktext=[f"{h:02d}:00" for h in range(0, 24)]
-                    )
-                    
-                    # Improve appearance
-                    fig.update_layout(
-                        height=400,
-                        margin=dict(l=20, r=20, t=40, b=20)
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Wind direction summary
-                    st.subheader("Wind Direction Summary")
-                    
-                    # Get the predominant wind direction for each day
-                    wind_summary = []
-                    for date, group in weather_df.groupby('date'):
-                        direction_counts = group['wind_direction'].value_counts()
-                        predominant_direction = direction_counts.index[0]
-                        avg_speed = group['wind_speed'].mean()
-                        max_speed = group['wind_speed'].max()
-                        
-                        wind_summary.append({
-                            'date': date,
-                            'date_str': format_date(date),
-                            'predominant_direction': predominant_direction,
-                            'avg_speed': avg_speed,
-                            'max_speed': max_speed
-                        })
-                    
-                    wind_summary_df = pd.DataFrame(wind_summary)
-                    
-                    # Display as a table
-                    if not wind_summary_df.empty:
-                        display_df = wind_summary_df[['date_str', 'predominant_direction', 'avg_speed', 'max_speed']]
-                        display_df.columns = ['Date', 'Predominant Direction', 'Avg Speed (mph)', 'Max Speed (mph)']
-                        
-                        # Custom styling for wind speed
-                        def color_wind_speed(val):
-                            if val > 15:
-                                return 'color: red'
-                            elif val > 10:
-                                return 'color: orange'
-                            return ''
-                        
-                        styled_wind = display_df.style.map(
-                            color_wind_speed, subset=['Max Speed (mph)']
-                        ).map(
-                            color_wind_speed, subset=['Avg Speed (mph)']
-                        )
-                        
-                        st.dataframe(styled_wind, use_container_width=True)
-                    else:
-                        st.info("Could not determine wind patterns from the available data.")
-                else:
-                    st.error("Weekly weather data not available")
+                _weather_trends_tab(weekly_rec_df)
         
         except Exception as e:
             st.error(f"Error loading weekly data: {str(e)}")
@@ -982,4 +1103,4 @@ else:  # Weekly Overview
 
 # Add footer
 st.markdown("---")
-st.caption("Kayak Launch Assistant • Data refreshed: " + get_pacific_time().strftime("%m/%d/%Y %H:%M"))
+st.caption("Kayak Launch Assistant • Data refreshed: " + now.strftime("%m/%d/%Y %H:%M"))
@@ -1,8 +1,81 @@
+import hashlib
+import logging
+import re
+import threading
 import trafilatura
 import streamlit as st
 from datetime import datetime
 import pytz
 
+logger = logging.getLogger(__name__)
+
+PACIFIC_TZ = pytz.timezone('US/Pacific')
+
+# Extracted text keyed on a hash of the downloaded page, shared by every
+# session; NOAA often serves the same page for a while, so re-fetches after
+# the hourly cache expires usually skip extraction altogether
+_EXTRACT_CACHE = {}
+_EXTRACT_CACHE_SIZE = 32
+_EXTRACT_CACHE_LOCK = threading.Lock()
+
+# Marine forecast section headers, matched a line at a time and checked in
+# priority order; the group name is the section a header starts
+SECTION_HEADER_RE = re.compile(
+    r"^(?:"
+    r"(?=.*SMALL CRAFT ADVISORY)(?P<small_craft_advisory>)"
+    r"|(?=.*TONIGHT)(?P<tonight>)"
+    r"|(?=.*(?:TOMORROW|TODAY))(?P<tomorrow>)"
+    r"|(?=.*COASTAL WATERS FORECAST)(?P<coastal_waters_forecast>)"
+    r"|(?=.*PZZ)(?P<zone_info>)"
+    r"|(?=.*FT)(?=.*(?:WIND|WAVES|SEAS))(?P<conditions>)"
+    r").*$",
+    re.MULTILINE
+)
+
+# Buoy observation labels, checked in priority order on each line that has a
+# following line; the group name is the observation key and group 1 captures
+# the next line (the value)
+OBSERVATION_LABEL_RE = re.compile(
+    r"^(?=.*\n(.*))(?:"
+    r"(?=.*Wind Direction)(?P<wind_direction>)"
+    r"|(?=.*Wind Speed)(?P<wind_speed>)"
+    r"|(?=.*Wind Gust)(?P<wind_gust>)"
+    r"|(?=.*Wave Height)(?P<wave_height>)"
+    r"|(?=.*Atmospheric Pressure)(?P<pressure>)"
+    r"|(?=.*Air Temperature)(?P<air_temp>)"
+    r"|(?=.*Water Temperature)(?P<water_temp>)"
+    r").*",
+    re.MULTILINE
+)
+
+def _extract_text(downloaded):
+    """
+    Extract the main text from a downloaded page, reusing earlier results
+    for identical content
+    
+    Args:
+        downloaded: Page HTML as returned by trafilatura.fetch_url
+        
+    Returns:
+        Extracted text, or None if nothing could be extracted
+    """
+    data = downloaded.encode() if isinstance(downloaded, str) else downloaded
+    key = hashlib.blake2b(data, digest_size=16).hexdigest()
+    with _EXTRACT_CACHE_LOCK:
+        if key in _EXTRACT_CACHE:
+            return _EXTRACT_CACHE[key]
+    
+    # fast=True skips trafilatura's readability/justext fallback extractors;
+    # tables are kept since the observation and tide pages are tabular
+    text = trafilatura.extract(downloaded, include_comments=False, fast=True)
+    
+    # Drop the oldest entry once full
+    with _EXTRACT_CACHE_LOCK:
+        if key not in _EXTRACT_CACHE and len(_EXTRACT_CACHE) >= _EXTRACT_CACHE_SIZE:
+            _EXTRACT_CACHE.pop(next(iter(_EXTRACT_CACHE)), None)
+        _EXTRACT_CACHE[key] = text
+    return text
+
 @st.cache_data(ttl=3600)  # Cache for 1 hour
 def get_marine_weather_text(location="puget_sound"):
     """
@@ -17,8 +90,7 @@ def get_marine_weather_text(location="puget_sound"):
     """
     try:
         # Get the current time in Pacific timezone
-        pacific_tz = pytz.timezone('US/Pacific')
-        current_time = datetime.now(pacific_tz).strftime('%H:%M %Z')
+        current_time = datetime.now(PACIFIC_TZ).strftime('%H:%M %Z')
         
         # NOAA Marine Forecasts URL for Puget Sound
         url = "https://marine.weather.gov/MapClick.php?zoneid=PZZ131"
@@ -26,82 +98,56 @@ def get_marine_weather_text(location="puget_sound"):
         # Fetch and extract text from the URL
         downloaded = trafilatura.fetch_url(url)
         if not downloaded:
-            print(f"Failed to download content from {url}")
+            logger.warning("Failed to download content from %s", url)
             return {
                 "status": "error",
                 "error": "Failed to download marine forecast",
                 "updated": current_time
             }
         
-        text = trafilatura.extract(downloaded)
+        text = _extract_text(downloaded)
         if not text:
-            print(f"Failed to extract text from {url}")
+            logger.warning("Failed to extract text from %s", url)
             return {
                 "status": "error",
                 "error": "Failed to extract marine forecast text",
                 "updated": current_time
             }
         
-        # Process the text to extract relevant sections
+        # Process the text to extract relevant sections: drop blank lines and
+        # surrounding whitespace once, then find every section header in a
+        # single regex pass and slice out the text between them
+        text = "\n".join(filter(None, map(str.strip, text.split('\n'))))
+        
         sections = {}
-        current_section = "overview"
-        sections[current_section] = []
-        
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check for major section headers
-            if "SMALL CRAFT ADVISORY" in line:
-                current_section = "small_craft_advisory"
-                sections[current_section] = [line]
-            elif "TONIGHT" in line:
-                current_section = "tonight"
-                sections[current_section] = [line]
-            elif "TOMORROW" in line or "TODAY" in line:
-                current_section = "tomorrow"
-                sections[current_section] = [line]
-            elif "COASTAL WATERS FORECAST" in line:
-                current_section = "coastal_waters_forecast"
-                sections[current_section] = [line]
-            elif "PZZ" in line:
-                current_section = "zone_info"
-                sections[current_section] = [line]
-            elif "FT" in line and ("WIND" in line or "WAVES" in line or "SEAS" in line):
-                current_section = "conditions"
-                sections[current_section] = [line]
-            else:
-                # Add line to current section
-                if current_section in sections:
-                    sections[current_section].append(line)
+        current_section, section_start = "overview", 0
+        for header in SECTION_HEADER_RE.finditer(text):
+            sections[current_section] = text[section_start:header.start()].rstrip('\n')
+            current_section, section_start = header.lastgroup, header.start()
+        sections[current_section] = text[section_start:]
         
         # Format the results
         result = {
             "status": "success",
             "updated": current_time,
-            "sections": {}
+            "sections": sections
         }
         
-        # Extract key information
-        for section, lines in sections.items():
-            result["sections"][section] = "\n".join(lines)
-        
-        # Extract important warnings
+        # Extract important warnings (the advisory header line)
         warnings = []
         if "small_craft_advisory" in sections:
-            warnings.append(sections["small_craft_advisory"][0])
+            warnings.append(sections["small_craft_advisory"].partition('\n')[0])
         
         result["warnings"] = warnings if warnings else ["No current marine warnings for this area"]
         
         return result
         
     except Exception as e:
-        print(f"Error getting marine forecast: {e}")
+        logger.warning("Error getting marine forecast: %s", e)
         return {
             "status": "error",
             "error": str(e),
-            "updated": datetime.now(pacific_tz).strftime('%H:%M %Z')
+            "updated": datetime.now(PACIFIC_TZ).strftime('%H:%M %Z')
         }
 
 @st.cache_data(ttl=3600)  # Cache for 1 hour
@@ -115,8 +161,7 @@ def get_tide_information():
     """
     try:
         # Get the current time in Pacific timezone
-        pacific_tz = pytz.timezone('US/Pacific')
-        current_time = datetime.now(pacific_tz).strftime('%H:%M %Z')
+        current_time = datetime.now(PACIFIC_TZ).strftime('%H:%M %Z')
         
         # NOAA Tides and Currents for Seattle
         url = "https://tidesandcurrents.noaa.gov/noaatidepredictions.html?id=9447130"
@@ -124,16 +169,16 @@ def get_tide_information():
         # Fetch and extract text from the URL
         downloaded = trafilatura.fetch_url(url)
         if not downloaded:
-            print(f"Failed to download content from {url}")
+            logger.warning("Failed to download content from %s", url)
             return {
                 "status": "error",
                 "error": "Failed to download tide information",
                 "updated": current_time
             }
         
-        text = trafilatura.extract(downloaded)
+        text = _extract_text(downloaded)
         if not text:
-            print(f"Failed to extract text from {url}")
+            logger.warning("Failed to extract text from %s", url)
             return {
                 "status": "error",
                 "error": "Failed to extract tide information text",
@@ -151,11 +196,11 @@ def get_tide_information():
         return tide_info
         
     except Exception as e:
-        print(f"Error getting tide information: {e}")
+        logger.warning("Error getting tide information: %s", e)
         return {
             "status": "error",
             "error": str(e),
-            "updated": datetime.now(pacific_tz).strftime('%H:%M %Z')
+            "updated": datetime.now(PACIFIC_TZ).strftime('%H:%M %Z')
         }
 
 @st.cache_data(ttl=3600)  # Cache for 1 hour
@@ -169,8 +214,7 @@ def get_marine_observations():
     """
     try:
         # Get the current time in Pacific timezone
-        pacific_tz = pytz.timezone('US/Pacific')
-        current_time = datetime.now(pacific_tz).strftime('%H:%M %Z')
+        current_time = datetime.now(PACIFIC_TZ).strftime('%H:%M %Z')
         
         # NOAA Buoy Data for Puget Sound
         url = "https://www.ndbc.noaa.gov/station_page.php?station=sisw1"
@@ -178,41 +222,28 @@ def get_marine_observations():
         # Fetch and extract text from the URL
         downloaded = trafilatura.fetch_url(url)
         if not downloaded:
-            print(f"Failed to download content from {url}")
+            logger.warning("Failed to download content from %s", url)
             return {
                 "status": "error",
                 "error": "Failed to download marine observations",
                 "updated": current_time
             }
         
-        text = trafilatura.extract(downloaded)
+        text = _extract_text(downloaded)
         if not text:
-            print(f"Failed to extract text from {url}")
+            logger.warning("Failed to extract text from %s", url)
             return {
                 "status": "error",
                 "error": "Failed to extract marine observations text",
                 "updated": current_time
             }
         
-        # Process the text to extract relevant information
-        lines = text.split('\n')
-        observations = {}
-        
-        for i, line in enumerate(lines):
-            if "Wind Direction" in line and i+1 < len(lines):
-                observations["wind_direction"] = lines[i+1].strip()
-            elif "Wind Speed" in line and i+1 < len(lines):
-                observations["wind_speed"] = lines[i+1].strip()
-            elif "Wind Gust" in line and i+1 < len(lines):
-                observations["wind_gust"] = lines[i+1].strip()
-            elif "Wave Height" in line and i+1 < len(lines):
-                observations["wave_height"] = lines[i+1].strip()
-            elif "Atmospheric Pressure" in line and i+1 < len(lines):
-                observations["pressure"] = lines[i+1].strip()
-            elif "Air Temperature" in line and i+1 < len(lines):
-                observations["air_temp"] = lines[i+1].strip()
-            elif "Water Temperature" in line and i+1 < len(lines):
-                observations["water_temp"] = lines[i+1].strip()
+        # Process the text to extract relevant information: every labelled
+        # line's value is on the line after it
+        observations = {
+            label.lastgroup: label.group(1).strip()
+            for label in OBSERVATION_LABEL_RE.finditer(text)
+        }
         
         return {
             "status": "success",
@@ -222,9 +253,9 @@ def get_marine_observations():
         }
         
     except Exception as e:
-        print(f"Error getting marine observations: {e}")
+        logger.warning("Error getting marine observations: %s", e)
         return {
             "status": "error",
             "error": str(e),
-            "updated": datetime.now(pacific_tz).strftime('%H:%M %Z')
+            "updated": datetime.now(PACIFIC_TZ).strftime('%H:%M %Z')
         }
\ No newline at end of file
@@ -1,15 +1,15 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import math
 from utils import (
     is_high_tide,
     is_strong_current,
     is_high_wind,
-    get_optimal_tide_range,
-    get_optimal_current_range,
-    get_optimal_wind_range,
-    ferry_time_proximity,
-    get_tide_status
+    OPTIMAL_TIDE_RANGE,
+    OPTIMAL_CURRENT_RANGE,
+    OPTIMAL_WIND_RANGE,
+    ferry_time_proximity_many
 )
 from api_clients import get_sun_times
 
@@ -18,6 +18,12 @@ OPTIMAL_COLOR = "#2ecc71"  # Green
 ACCEPTABLE_COLOR = "#f1c40f"  # Yellow/Orange
 NOT_RECOMMENDED_COLOR = "#e74c3c"  # Red
 
+def _first_by_hour(df):
+    """Return the first row for each hour of the day, indexed by hour."""
+    hours = df['time'].dt.hour
+    first = ~hours.duplicated()
+    return df[first].set_index(hours[first].rename('hour'))
+
 def get_launch_recommendations(tide_data, current_data, ferry_data, weather_data):
     """
     Generate kayak launch recommendations by combining all data sources
@@ -25,184 +31,167 @@ def get_launch_recommendations(tide_data, current_data, ferry_data, weather_data
     Args:
         tide_data: DataFrame of tide predictions
         current_data: DataFrame of current predictions
-        ferry_data: List of ferry schedule data
+        ferry_data: DataFrame of ferry departures
         weather_data: DataFrame of weather predictions
         
     Returns:
         List of hourly recommendations with ratings
     """
+    return get_launch_recommendation_frame(
+        tide_data, current_data, ferry_data, weather_data
+    ).to_dict('records')
+
+def get_launch_recommendation_frame(tide_data, current_data, ferry_data, weather_data):
+    """
+    Generate kayak launch recommendations as a DataFrame, one row per daylight hour
+    
+    Args:
+        tide_data: DataFrame of tide predictions
+        current_data: DataFrame of current predictions
+        ferry_data: DataFrame of ferry departures
+        weather_data: DataFrame of weather predictions
+        
+    Returns:
+        DataFrame of hourly recommendations with ratings, best score first
+        (empty if any data is missing)
+    """
     # Check for missing data
-    if tide_data is None or current_data is None or not ferry_data or weather_data is None:
+    if tide_data is None or current_data is None or ferry_data is None or ferry_data.empty or weather_data is None:
         print("Warning: Missing data for recommendations")
-        return []
-    
-    # Get ranges for optimal conditions
-    optimal_tide_range = get_optimal_tide_range()
-    optimal_current_range = get_optimal_current_range()
-    optimal_wind_range = get_optimal_wind_range()
+        return pd.DataFrame()
     
     # Get sunrise/sunset times for the selected date
-    date = tide_data['time'].iloc[0].date()
+    date = tide_data['time'].iat[0].date()
     sun_times = get_sun_times(date)
     
-    # Initialize recommendations
-    recommendations = []
+    # Daylight window (including 30 min buffer before sunrise and after sunset) as naive local times
+    midnight = datetime.combine(date, datetime.min.time())
+    daylight_start = sun_times['sunrise_buffer'].replace(tzinfo=None)
+    daylight_end = sun_times['sunset_buffer'].replace(tzinfo=None)
     
-    # Process hourly data
-    for hour in range(24):
-        # Create time point for this hour
-        hour_time = tide_data['time'].iloc[0].replace(hour=hour, minute=0, second=0)
-        
-        # Get tide data for this hour
-        tide_hour_data = tide_data[tide_data['time'].dt.hour == hour]
-        if tide_hour_data.empty:
-            continue
-        
-        tide_height = tide_hour_data['height'].iloc[0]
-        previous_hour = (hour - 1) % 24
-        previous_tide_data = tide_data[tide_data['time'].dt.hour == previous_hour]
-        previous_height = previous_tide_data['height'].iloc[0] if not previous_tide_data.empty else None
-        tide_status = get_tide_status(tide_height, previous_height)
-        
-        # Get current data for this hour
-        current_hour_data = current_data[current_data['time'].dt.hour == hour]
-        if current_hour_data.empty:
-            continue
-        
-        current_speed = current_hour_data['speed'].iloc[0]
-        # Get current direction text based on actual NOAA values
-        # For our station, when Velocity_Major is positive = flood, negative = ebb
-        if 'direction' in current_hour_data:
-            current_direction = current_hour_data['direction'].iloc[0]
-            current_velocity_value = current_speed  # We've already converted to absolute in the data fetching
-            
-            # Interpret current direction based on the NOAA values
-            if current_direction < 120:  # Near 69 degrees = Flood direction
-                current_direction_text = 'flooding'
-            elif current_direction > 200:  # Near 240 degrees = Ebb direction
-                current_direction_text = 'ebbing'
-            else:
-                current_direction_text = 'mixed'
-        else:
-            current_direction_text = 'unknown'
-        
-        # Get weather data for this hour
-        weather_hour_data = weather_data[weather_data['time'].dt.hour == hour]
-        if weather_hour_data.empty:
-            # Find the closest weather data point
-            closest_hour = min(weather_data['time'], key=lambda x: abs((x - hour_time).total_seconds()))
-            weather_hour_data = weather_data[weather_data['time'] == closest_hour]
-            if weather_hour_data.empty:
-                continue
-        
-        wind_speed = weather_hour_data['wind_speed'].iloc[0]
-        wind_direction = weather_hour_data['wind_direction'].iloc[0]
-        
-        # Get ferry information
-        min_to_ferry, ferry_direction = ferry_time_proximity(f"{hour}:00", ferry_data)
-        if min_to_ferry is not None:
-            if min_to_ferry < 15:
-                ferry_status = f"Caution: {ferry_direction} ferry in {int(min_to_ferry)} minutes"
-            elif min_to_ferry < 30:
-                ferry_status = f"{ferry_direction} ferry in {int(min_to_ferry)} minutes"
-            else:
-                ferry_status = "No ferries soon"
-        else:
-            ferry_status = "No ferry data"
-        
-        # Calculate rating based on all factors
-        
-        # Tide factor (0-1, 1 is best)
-        if optimal_tide_range[0] <= tide_height <= optimal_tide_range[1]:
-            tide_factor = 1.0
-        else:
-            # How far outside optimal range
-            if tide_height < optimal_tide_range[0]:
-                tide_factor = 1.0 - min(1.0, (optimal_tide_range[0] - tide_height) / 4.0)
-            else:  # tide_height > optimal_tide_range[1]
-                tide_factor = 1.0 - min(1.0, (tide_height - optimal_tide_range[1]) / 4.0)
-        
-        # Beach disappears at high tide
-        if tide_height > 10.0:
-            tide_factor = 0.0  # No beach access
-        
-        # Current factor (0-1, 1 is best)
-        if optimal_current_range[0] <= current_speed <= optimal_current_range[1]:
-            current_factor = 1.0
-        else:
-            # How far outside optimal range
-            if current_speed < optimal_current_range[0]:
-                current_factor = 1.0  # Slow current is fine
-            else:  # current_speed > optimal_current_range[1]
-                current_factor = 1.0 - min(1.0, (current_speed - optimal_current_range[1]) / 2.0)
-        
-        # Wind factor (0-1, 1 is best)
-        if optimal_wind_range[0] <= wind_speed <= optimal_wind_range[1]:
-            wind_factor = 1.0
-        else:
-            # How far outside optimal range
-            if wind_speed < optimal_wind_range[0]:
-                wind_factor = 1.0  # Light wind is fine
-            else:  # wind_speed > optimal_wind_range[1]
-                wind_factor = 1.0 - min(1.0, (wind_speed - optimal_wind_range[1]) / 10.0)
-        
-        # Ferry factor (0-1, 1 is best)
-        if min_to_ferry is not None and min_to_ferry < 15:
-            ferry_factor = 0.5  # Caution near ferry times
-        else:
-            ferry_factor = 1.0
-        
-        # Combine factors with weights
-        weighted_score = (
-            tide_factor * 0.35 +    # Tide is very important for beach access
-            current_factor * 0.3 +  # Current is important for safety
-            wind_factor * 0.25 +    # Wind affects wave conditions
-            ferry_factor * 0.1      # Ferry proximity is a concern but can be managed
+    # Index every source by hour once (first reading in each hour) instead of
+    # filtering the full frames on every iteration
+    tide_by_hour = _first_by_hour(tide_data)
+    current_by_hour = _first_by_hour(current_data)
+    weather_by_hour = _first_by_hour(weather_data)
+    
+    # Only hours with both tide and current readings get a recommendation
+    hours = tide_by_hour.index.intersection(current_by_hour.index).sort_values()
+    
+    # Hour start times on the requested date
+    hour_datetimes = pd.Timestamp(midnight) + pd.to_timedelta(hours, unit='h')
+    
+    hourly = pd.DataFrame({
+        'tide_height': tide_by_hour['height'].reindex(hours),
+        'previous_height': tide_by_hour['height'].reindex((hours - 1) % 24).to_numpy(),
+        'current_speed': current_by_hour['speed'].reindex(hours),
+        'current_direction': current_by_hour['direction'].reindex(hours) if 'direction' in current_data else np.nan
+    }, index=hours).astype(float)
+    
+    # Weather for each hour, falling back to the closest forecast time
+    # for hours the forecast doesn't cover (e.g. 3-hourly forecasts)
+    weather_times = weather_data['time'].to_numpy()
+    closest = np.abs(weather_times[None, :] - hour_datetimes.to_numpy()[:, None]).argmin(axis=1)
+    weather_rows = weather_data.iloc[closest].set_index(hours)
+    has_hour = hours.isin(weather_by_hour.index)
+    weather_rows.loc[has_hour] = weather_by_hour.loc[hours[has_hour], weather_rows.columns]
+    hourly['wind_speed'] = weather_rows['wind_speed'].astype(float)
+    hourly['wind_direction'] = weather_rows['wind_direction']
+    
+    tide_height = hourly['tide_height'].to_numpy()
+    previous_height = hourly['previous_height'].to_numpy()
+    current_speed = hourly['current_speed'].to_numpy()
+    wind_speed = hourly['wind_speed'].to_numpy()
+    
+    # Tide is rising/falling relative to the previous hour (steady if unknown)
+    tide_status = np.select(
+        [tide_height > previous_height, tide_height < previous_height],
+        ["rising", "falling"],
+        default="steady"
+    )
+    
+    # Get current direction text based on actual NOAA values
+    # For our station, when Velocity_Major is positive = flood, negative = ebb
+    if 'direction' in current_data:
+        current_direction = hourly['current_direction'].to_numpy()
+        current_direction_text = np.select(
+            [current_direction < 120, current_direction > 200],  # Near 69 degrees = Flood, near 240 = Ebb
+            ['flooding', 'ebbing'],
+            default='mixed'
         )
-        
-        # Assign rating based on combined score
-        if weighted_score >= 0.8:
-            rating = "optimal"
-        elif weighted_score >= 0.6:
-            rating = "acceptable"
-        else:
-            rating = "not_recommended"
-        
-        # Create recommendation entry
-        recommendation = {
-            'hour': hour,
-            'start_time': f"{hour:02d}:00",
-            'end_time': f"{(hour+1) % 24:02d}:00",
-            'tide_height': f"{tide_height:.1f}",
-            'tide_status': tide_status,
-            'current_speed': f"{current_speed:.1f}",
-            'current_direction': current_direction_text,
-            'wind_speed': f"{wind_speed:.1f}",
-            'wind_direction': wind_direction,
-            'ferry_status': ferry_status,
-            'score': weighted_score,
-            'rating': rating,
-            'is_daylight': False  # Default to False
-        }
-        
-        # Check if this hour is during daylight hours (including 30 min buffer before sunrise and after sunset)
-        hour_datetime = datetime.combine(date, datetime.min.time()).replace(hour=hour)
-        if (sun_times['sunrise_buffer'].replace(tzinfo=None) <= hour_datetime < 
-            sun_times['sunset_buffer'].replace(tzinfo=None)):
-            recommendation['is_daylight'] = True
-            
-            # Keep the rating as is during daylight
-        else:
-            # Hours outside of daylight should never be optimal
-            if recommendation['rating'] == 'optimal':
-                recommendation['rating'] = 'acceptable'
-        
-        recommendations.append(recommendation)
+    else:
+        current_direction_text = 'unknown'
     
-    # Filter recommendations to only include daylight hours
-    daylight_recommendations = [r for r in recommendations if r['is_daylight']]
+    # Get ferry information for every hour at once
+    min_to_ferry, ferry_direction = ferry_time_proximity_many(hour_datetimes, ferry_data)
+    ferry_message = (
+        pd.Series(ferry_direction, dtype=object).fillna('') + " ferry in " +
+        pd.Series(np.nan_to_num(min_to_ferry)).astype(int).astype(str) + " minutes"
+    ).to_numpy()
+    ferry_status = np.select(
+        [np.isnan(min_to_ferry), min_to_ferry < 15, min_to_ferry < 30],
+        ["No ferry data", "Caution: " + ferry_message, ferry_message],
+        default="No ferries soon"
+    )
     
-    # Sort by score to ensure best times are listed first
-    daylight_recommendations.sort(key=lambda x: float(x['score']), reverse=True)
+    # Calculate rating based on all factors, for every hour at once
+    
+    # Tide factor (0-1, 1 is best): drops off with distance outside the optimal range
+    tide_distance = np.maximum(np.maximum(OPTIMAL_TIDE_RANGE[0] - tide_height, tide_height - OPTIMAL_TIDE_RANGE[1]), 0.0)
+    tide_factor = 1.0 - np.minimum(1.0, tide_distance / 4.0)
+    
+    # Beach disappears at high tide
+    tide_factor = np.where(tide_height > 10.0, 0.0, tide_factor)  # No beach access
+    
+    # Current factor (0-1, 1 is best); slow current is fine
+    current_factor = 1.0 - np.minimum(1.0, np.maximum(current_speed - OPTIMAL_CURRENT_RANGE[1], 0.0) / 2.0)
+    
+    # Wind factor (0-1, 1 is best); light wind is fine
+    wind_factor = 1.0 - np.minimum(1.0, np.maximum(wind_speed - OPTIMAL_WIND_RANGE[1], 0.0) / 10.0)
+    
+    # Ferry factor (0-1, 1 is best): caution near ferry times
+    ferry_factor = np.where(min_to_ferry < 15, 0.5, 1.0)
     
-    return daylight_recommendations
+    # Combine factors with weights
+    weighted_score = (
+        tide_factor * 0.35 +    # Tide is very important for beach access
+        current_factor * 0.3 +  # Current is important for safety
+        wind_factor * 0.25 +    # Wind affects wave conditions
+        ferry_factor * 0.1      # Ferry proximity is a concern but can be managed
+    )
+    
+    # Assign rating based on combined score
+    rating = np.select(
+        [weighted_score >= 0.8, weighted_score >= 0.6],
+        ["optimal", "acceptable"],
+        default="not_recommended"
+    )
+    
+    # Check which hours are during daylight hours (including 30 min buffer before sunrise and after sunset)
+    is_daylight = (hour_datetimes >= daylight_start) & (hour_datetimes < daylight_end)
+    
+    # Create recommendation entries
+    recommendations = pd.DataFrame({
+        'hour': hours,
+        'start_time': [f"{hour:02d}:00" for hour in hours],
+        'end_time': [f"{(hour+1) % 24:02d}:00" for hour in hours],
+        'tide_height': hourly['tide_height'].map("{:.1f}".format).to_numpy(),
+        'tide_status': tide_status,
+        'current_speed': hourly['current_speed'].map("{:.1f}".format).to_numpy(),
+        'current_direction': current_direction_text,
+        'wind_speed': hourly['wind_speed'].map("{:.1f}".format).to_numpy(),
+        'wind_direction': hourly['wind_direction'].to_numpy(),
+        'ferry_status': ferry_status,
+        'score': weighted_score,
+        'rating': rating,
+        'is_daylight': is_daylight
+    })
+    
+    # Filter recommendations to only include daylight hours (hours outside of
+    # daylight are never shown, so their ratings don't need adjusting)
+    daylight_recommendations = recommendations[recommendations['is_daylight']]
+    
+    # Sort by score to ensure best times are listed first
+    return daylight_recommendations.sort_values(
+        'score', ascending=False, kind='stable', ignore_index=True
+    )
@@ -1,12 +1,20 @@
+import functools
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import pytz
 
+# US style date format used for every date shown in the app
+DATE_FORMAT = "%m/%d/%Y"
+
 def get_pacific_time():
     """Get current time in Pacific timezone"""
     pacific = pytz.timezone('US/Pacific')
     return datetime.now(pytz.utc).astimezone(pacific)
 
+# Only a handful of distinct dates/times are shown per run, so formatted
+# strings are memoized
+@functools.lru_cache(maxsize=512)
 def format_time(dt_obj):
     """Format datetime object to 24-hour military time string (HH:MM)"""
     if isinstance(dt_obj, datetime):
@@ -17,11 +25,12 @@ def format_time(dt_obj):
         return dt_obj.strftime("%H:%M")
     return dt_obj
 
+@functools.lru_cache(maxsize=512)
 def format_date(date_obj):
     """Format date object to US style string (MM/DD/YYYY)"""
     if isinstance(date_obj, datetime):
         date_obj = date_obj.date()
-    return date_obj.strftime("%m/%d/%Y")
+    return date_obj.strftime(DATE_FORMAT)
 
 def get_date_range(selected_date, view_option):
     """
@@ -56,14 +65,21 @@ def is_high_wind(speed):
     # Adjust thresholds based on local knowledge
     return speed > 15.0
 
+# 16-point compass directions, 22.5 degrees apart starting from north
+WIND_DIRECTIONS = np.array([
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
+], dtype=object)
+
 def get_wind_direction_text(degrees):
     """Convert wind direction degrees to cardinal direction text"""
-    directions = [
-        "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-        "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-    ]
     index = round(degrees / 22.5) % 16
-    return directions[index]
+    return WIND_DIRECTIONS[index]
+
+def wind_direction_text_vec(degrees):
+    """Convert an array of wind direction degrees to cardinal direction text"""
+    index = np.round(np.asarray(degrees, dtype=float) / 22.5).astype(int) % 16
+    return WIND_DIRECTIONS[index]
 
 def knots_to_mph(knots):
     """Convert speed from knots to miles per hour"""
@@ -81,72 +97,100 @@ def get_tide_status(height, previous_height=None):
     else:
         return "steady"
 
+# Optimal (min, max) ranges for kayaking at Point White
+# These are example values and should be adjusted based on local conditions
+OPTIMAL_TIDE_RANGE = (
+    4.0,  # Low enough for beach access but not too low
+    8.0   # High enough for water depth but beach still accessible
+)
+OPTIMAL_CURRENT_RANGE = (
+    0.0,  # Minimal current is generally better for beginners
+    1.73  # Not too strong to paddle against (1.5 knots converted to mph)
+)
+OPTIMAL_WIND_RANGE = (
+    0.0,  # Minimal wind is generally better
+    10.0  # Not too strong to create challenging waves
+)
+
 def get_optimal_tide_range():
     """Get the optimal tide height range for kayaking at Point White"""
-    # These are example values and should be adjusted based on local conditions
-    min_height = 4.0  # Low enough for beach access but not too low
-    max_height = 8.0  # High enough for water depth but beach still accessible
-    return (min_height, max_height)
+    return OPTIMAL_TIDE_RANGE
 
 def get_optimal_current_range():
     """Get the optimal current speed range for kayaking at Point White"""
-    # These are example values and should be adjusted based on local conditions
-    min_speed = 0.0  # Minimal current is generally better for beginners
-    max_speed = 1.73  # Not too strong to paddle against (1.5 knots converted to mph)
-    return (min_speed, max_speed)
+    return OPTIMAL_CURRENT_RANGE
 
 def get_optimal_wind_range():
     """Get the optimal wind speed range for kayaking at Point White"""
-    # These are example values and should be adjusted based on local conditions
-    min_speed = 0.0  # Minimal wind is generally better
-    max_speed = 10.0  # Not too strong to create challenging waves
-    return (min_speed, max_speed)
+    return OPTIMAL_WIND_RANGE
 
-def ferry_time_proximity(time, ferry_schedule):
+def ferry_time_proximity_many(times, ferry_schedule):
     """
-    Determine proximity to next ferry
+    Determine proximity to the next ferry for many times at once
     
     Args:
-        time: Time to check
-        ferry_schedule: List of ferry departure times
+        times: Sequence of datetimes to check
+        ferry_schedule: DataFrame of ferry departures (departure_time and direction columns)
         
     Returns:
-        Tuple: (minutes_to_ferry, direction)
+        Tuple of arrays: (minutes_to_ferry, direction), with NaN/None where
+        no ferry departs after that time
     """
-    if not ferry_schedule:
-        return None, None
+    times = np.asarray(times, dtype="datetime64[ns]")
+    if ferry_schedule is None or ferry_schedule.empty:
+        return np.full(len(times), np.nan), np.full(len(times), None, dtype=object)
     
-    # Convert string time to datetime if needed
-    if not isinstance(time, datetime):
-        hours, minutes = map(int, time.split(':'))
-        time = datetime.now().replace(hour=hours, minute=minutes, second=0, microsecond=0)
+    departure_times = ferry_schedule['departure_time'].to_numpy(dtype="datetime64[ns]")
+    directions = ferry_schedule['direction'].to_numpy(dtype=object)
     
-    # Find the next ferry
-    next_ferry = None
-    min_diff = float('inf')
-    direction = None
+    # Minutes from every time to every departure, ignoring ferries that already left
+    diffs = (departure_times[None, :] - times[:, None]) / np.timedelta64(1, "m")
+    diffs = np.where(diffs >= 0, diffs, np.inf)
     
-    for ferry in ferry_schedule:
-        ferry_time = ferry['departure_time']
-        ferry_dir = ferry['direction']
-        
-        # Calculate time difference in minutes
-        diff = (ferry_time - time).total_seconds() / 60
+    next_ferry = diffs.argmin(axis=1)
+    minutes = diffs[np.arange(len(times)), next_ferry]
+    has_ferry = np.isfinite(minutes)
+    
+    return np.where(has_ferry, minutes, np.nan), np.where(has_ferry, directions[next_ferry], None)
+
+def lttb_indices(x, y, n_out):
+    """
+    Pick the points of a series to keep when downsampling it for a chart,
+    using Largest-Triangle-Three-Buckets so peaks and troughs survive
+    
+    Args:
+        x: Sorted x values (numeric)
+        y: y values
+        n_out: Number of points to keep
         
-        # Only consider upcoming ferries
-        if 0 <= diff < min_diff:
-            min_diff = diff
-            next_ferry = ferry_time
-            direction = ferry_dir
+    Returns:
+        Array of positional indices into x/y, including the first and last point
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
     
-    if next_ferry:
-        return min_diff, direction
-    else:
-        # If no upcoming ferry found, check for the earliest ferry tomorrow
-        tomorrow_ferries = [f for f in ferry_schedule if f['departure_time'].day > time.day]
-        if tomorrow_ferries:
-            earliest = min(tomorrow_ferries, key=lambda x: x['departure_time'])
-            diff = (earliest['departure_time'] - time).total_seconds() / 60
-            return diff, earliest['direction']
+    # Interior points are split into n_out - 2 buckets; one point is kept per bucket
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
         
-        return None, None
+        # Keep the point forming the largest triangle with the previously kept
+        # point and the average of the next bucket
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous]) -
+            (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + areas.argmax()
+        indices[i + 1] = previous
+    
+    return indices
@@ -1,101 +1,251 @@
 import requests
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlsplit
 import pytz
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Cache webcam images to avoid hitting rate limits
-@st.cache_data(ttl=600)  # Cache for 10 minutes
-def get_webcam_image(url):
+logger = logging.getLogger(__name__)
+
+PACIFIC_TZ = pytz.timezone('US/Pacific')
+
+# Shared HTTP session so webcam requests (mostly to images.wsdot.wa.gov) reuse
+# pooled keep-alive connections instead of a new TCP+TLS handshake per image
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+
+# Most webcams are on images.wsdot.wa.gov; cap the requests in flight to any
+# one host so concurrent refreshes don't get throttled
+MAX_REQUESTS_PER_HOST = 4
+_HOST_SLOTS = {}
+
+def _host_slot(url):
+    """Get the semaphore limiting concurrent requests to a URL's host"""
+    host = urlsplit(url).hostname
+    return _HOST_SLOTS.setdefault(host, threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST))
+
+@st.cache_resource
+def _last_good_images():
     """
-    Get a webcam image from a URL
+    Last successfully fetched image for each URL as (bytes, etag, last_modified)
+    
+    A single mutable dict shared by every session (not copied per session like
+    st.cache_data results). The validators let refreshes be conditional
+    requests, and the bytes are served when a refresh fails so a flaky webcam
+    keeps its last picture
+    """
+    return {}
+
+def _read_body(response):
+    """
+    Read a streamed response body, straight into a buffer of the advertised
+    size when the length is known
     
     Args:
-        url: The URL of the webcam image
+        response: A requests response opened with stream=True
         
     Returns:
-        The image bytes if successful, None otherwise
+        The body bytes
     """
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        print(f"Response status for {url}: {response.status_code}")
-        if response.status_code == 200:
-            return response.content
+    length = int(response.headers.get('Content-Length') or 0)
+    
+    # Compressed bodies decode to a different length than advertised
+    if length <= 0 or response.headers.get('Content-Encoding'):
+        return response.content
+    
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    offset = 0
+    for chunk in response.iter_content(65536):
+        end = offset + len(chunk)
+        if end <= length:
+            view[offset:end] = chunk
         else:
-            print(f"Failed to get image from {url}, status code: {response.status_code}")
-            return None
-    except Exception as e:
-        print(f"Error getting webcam image: {e}")
-        return None
+            # Longer than advertised; grow the buffer for the rest
+            view.release()
+            buffer[offset:] = chunk
+            view = memoryview(buffer)
+        offset = end
+    view.release()
+    del buffer[offset:]
+    return bytes(buffer)
 
-def get_seattle_ferry_webcam():
+def _fetch_webcam_image(url):
     """
-    Get the Seattle-Bainbridge Ferry Terminal webcam image
+    Fetch a webcam image from a URL (uncached)
     
+    Args:
+        url: The URL of the webcam image
+        
     Returns:
-        The image bytes if successful, None otherwise
+        The image bytes if successful, otherwise the last image fetched
+        from the URL (None if there never was one)
     """
-    # Seattle ferry terminal view - updated URL from WSDOT traffic cameras
-    url = "https://images.wsdot.wa.gov/nw/099vc16008.jpg"
-    return get_webcam_image(url)
+    last_good = _last_good_images()
+    last_image, etag, last_modified = last_good.get(url, (None, None, None))
+    
+    # Ask the server to skip the body if the image hasn't changed
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    
+    try:
+        with _host_slot(url), _SESSION.get(url, headers=headers, timeout=10, stream=True) as response:
+            if response.status_code == 200:
+                image = _read_body(response)
+                last_good[url] = (
+                    image,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified')
+                )
+                return image
+            elif response.status_code == 304:
+                return last_image
+            else:
+                logger.warning("Failed to get image from %s, status code: %s", url, response.status_code)
+                return last_image
+    except Exception as e:
+        logger.warning("Error getting webcam image from %s: %s", url, e)
+        return last_image
 
-def get_bainbridge_ferry_webcam():
+# Cache webcam images to avoid hitting rate limits, for longer on views that
+# change slowly: ferry terminals refresh often since arrivals matter,
+# harbor views are in between, and skyline/bridge shots rarely change
+@st.cache_data(ttl=60)  # Cache for 1 minute
+def _get_webcam_image_short(url):
+    """Get a webcam image from a URL, refreshed every minute"""
+    return _fetch_webcam_image(url)
+
+@st.cache_data(ttl=300)  # Cache for 5 minutes
+def _get_webcam_image_normal(url):
+    """Get a webcam image from a URL, refreshed every 5 minutes"""
+    return _fetch_webcam_image(url)
+
+@st.cache_data(ttl=1800)  # Cache for 30 minutes
+def _get_webcam_image_long(url):
+    """Get a webcam image from a URL, refreshed every 30 minutes"""
+    return _fetch_webcam_image(url)
+
+# Webcams near Point White: image URL, description and refresh interval
+# (seconds, one of the cached getters above)
+WEBCAMS = {
+    "Bainbridge Ferry Terminal": {
+        # Bainbridge Island ferry terminal camera
+        "url": "https://images.wsdot.wa.gov/nw/305vc00969.jpg",
+        "description": "View of the Bainbridge Island Ferry Terminal",
+        "ttl": 60
+    },
+    "Seattle Waterfront": {
+        # Seattle ferry terminal view - updated URL from WSDOT traffic cameras
+        "url": "https://images.wsdot.wa.gov/nw/099vc16008.jpg",
+        "description": "View of the Seattle Waterfront near Ferry Terminal",
+        "ttl": 60
+    },
+    "Elliott Bay": {
+        # Elliott Bay view
+        "url": "https://cdn.tegna-media.com/king/weather/seattleskyline.jpg",
+        "description": "View of Elliott Bay from Seattle",
+        "ttl": 300
+    },
+    "Bremerton Ferry Terminal": {
+        # Bremerton Terminal webcam
+        "url": "https://images.wsdot.wa.gov/sw/304vc00000.jpg",
+        "description": "View of the Bremerton Ferry Terminal",
+        "ttl": 60
+    },
+    "Puget Sound Weather": {
+        # Space Needle webcam showing Puget Sound weather
+        "url": "https://spaceneedle.com/wp-content/uploads/2023/06/spaceneedle_west.jpg",
+        "description": "View of Puget Sound weather conditions",
+        "ttl": 1800
+    },
+    "Tacoma Narrows": {
+        # Tacoma Narrows Bridge webcam (for water conditions in the South Sound)
+        "url": "https://images.wsdot.wa.gov/sw/016vc00438.jpg",
+        "description": "View of Tacoma Narrows Bridge and water conditions",
+        "ttl": 1800
+    }
+}
+
+# Cached getter for each refresh interval
+_CACHED_GETTERS = {
+    60: _get_webcam_image_short,
+    300: _get_webcam_image_normal,
+    1800: _get_webcam_image_long
+}
+
+# Refresh interval for each known webcam URL (others use 5 minutes)
+_TTL_BY_URL = {webcam["url"]: webcam["ttl"] for webcam in WEBCAMS.values()}
+
+def get_webcam_image(url):
     """
-    Get the Bainbridge Island Ferry Terminal webcam image
+    Get a webcam image from a URL
+    
+    Every path to a URL goes through here, so each image has exactly one
+    cache entry, refreshed at that webcam's interval
     
+    Args:
+        url: The URL of the webcam image
+        
     Returns:
-        The image bytes if successful, None otherwise
+        The image bytes if successful, otherwise the last image fetched
+        from the URL (None if there never was one)
     """
-    # Bainbridge Island ferry terminal camera
-    url = "https://images.wsdot.wa.gov/nw/305vc00969.jpg"
-    return get_webcam_image(url)
+    return _CACHED_GETTERS[_TTL_BY_URL.get(url, 300)](url)
 
-def get_elliot_bay_webcam():
+def get_webcam(name):
     """
-    Get a view of Elliott Bay
+    Get the image for one of the webcams in WEBCAMS
     
+    Args:
+        name: The webcam name (a WEBCAMS key)
+        
     Returns:
-        The image bytes if successful, None otherwise
+        The image bytes if successful, otherwise the last image fetched
+        from the URL (None if there never was one)
     """
-    # Elliott Bay view
-    url = "https://cdn.tegna-media.com/king/weather/seattleskyline.jpg"
-    return get_webcam_image(url)
+    return get_webcam_image(WEBCAMS[name]["url"])
+
+def get_seattle_ferry_webcam():
+    """Get the Seattle-Bainbridge Ferry Terminal webcam image"""
+    return get_webcam("Seattle Waterfront")
+
+def get_bainbridge_ferry_webcam():
+    """Get the Bainbridge Island Ferry Terminal webcam image"""
+    return get_webcam("Bainbridge Ferry Terminal")
+
+def get_elliot_bay_webcam():
+    """Get a view of Elliott Bay"""
+    return get_webcam("Elliott Bay")
 
 def get_bremerton_ferry_webcam():
-    """
-    Get the Bremerton Ferry Terminal webcam image
-    
-    Returns:
-        The image bytes if successful, None otherwise
-    """
-    # Bremerton Terminal webcam
-    url = "https://images.wsdot.wa.gov/sw/304vc00000.jpg"
-    return get_webcam_image(url)
+    """Get the Bremerton Ferry Terminal webcam image"""
+    return get_webcam("Bremerton Ferry Terminal")
 
 def get_tacoma_narrows_webcam():
-    """
-    Get a view of the Tacoma Narrows Bridge
-    
-    Returns:
-        The image bytes if successful, None otherwise
-    """
-    # Tacoma Narrows Bridge webcam (for water conditions in the South Sound)
-    url = "https://images.wsdot.wa.gov/sw/016vc00438.jpg"
-    return get_webcam_image(url)
+    """Get a view of the Tacoma Narrows Bridge"""
+    return get_webcam("Tacoma Narrows")
 
 def get_puget_sound_web_cam():
-    """
-    Get a view of Puget Sound weather conditions (Space Needle cam)
-    
-    Returns:
-        The image bytes if successful, None otherwise
-    """
-    # Space Needle webcam showing Puget Sound weather
-    url = "https://spaceneedle.com/wp-content/uploads/2023/06/spaceneedle_west.jpg"
-    return get_webcam_image(url)
+    """Get a view of Puget Sound weather conditions (Space Needle cam)"""
+    return get_webcam("Puget Sound Weather")
 
+# Not cached on purpose: current_time changes every minute and would churn
+# the cache, so image freshness is left to the per-URL cache in get_webcam_image
 def get_point_white_area_webcams():
     """
     Get all available webcams near Point White area
@@ -103,41 +253,26 @@ def get_point_white_area_webcams():
     Returns:
         Dictionary of webcam images with their descriptions
     """
-    pacific_tz = pytz.timezone('US/Pacific')
-    current_time = datetime.now(pacific_tz).strftime('%H:%M')
+    current_time = datetime.now(PACIFIC_TZ).strftime('%H:%M')
     
-    webcams = {
-        "Bainbridge Ferry Terminal": {
-            "image": get_bainbridge_ferry_webcam(),
-            "description": "View of the Bainbridge Island Ferry Terminal",
-            "updated": current_time
-        },
-        "Seattle Waterfront": {
-            "image": get_seattle_ferry_webcam(),
-            "description": "View of the Seattle Waterfront near Ferry Terminal",
-            "updated": current_time
-        },
-        "Elliott Bay": {
-            "image": get_elliot_bay_webcam(), 
-            "description": "View of Elliott Bay from Seattle",
-            "updated": current_time
-        },
-        "Bremerton Ferry Terminal": {
-            "image": get_bremerton_ferry_webcam(),
-            "description": "View of the Bremerton Ferry Terminal",
-            "updated": current_time
-        },
-        "Puget Sound Weather": {
-            "image": get_puget_sound_web_cam(),
-            "description": "View of Puget Sound weather conditions",
-            "updated": current_time
-        },
-        "Tacoma Narrows": {
-            "image": get_tacoma_narrows_webcam(),
-            "description": "View of Tacoma Narrows Bridge and water conditions",
+    # Fetch every image concurrently so the total wait is roughly the slowest
+    # single webcam rather than the sum of all of them; worker threads get the
+    # script context so the st.cache_data lookups behave as on the main thread
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=len(WEBCAMS),
+        initializer=add_script_run_ctx,
+        initargs=(None, ctx)
+    ) as executor:
+        images = dict(zip(WEBCAMS, executor.map(get_webcam, WEBCAMS)))
+    
+    # Skip any webcams that failed to load
+    return {
+        name: {
+            "image": images[name],
+            "description": webcam["description"],
             "updated": current_time
         }
+        for name, webcam in WEBCAMS.items()
+        if images[name] is not None
     }
-    
-    # Filter out any webcams that failed to load
-    return {k: v for k, v in webcams.items() if v["image"] is not None}
\ No newline at end of file